@@ -0,0 +1,638 @@
+"""NeoSong backend - audio enhancement API.
+
+Upload an audio file, apply effects (reverb, echo, EQ, compression,
+noise reduction, pitch/tempo, fades, background music) and download
+the processed result as MP3.
+"""
+import asyncio
+import json
+import logging
+import os
+import shutil
+import threading
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+import aiofiles
+import lameenc
+import librosa
+import mutagen
+import numpy as np
+import scipy.signal
+import soundfile
+import uvicorn
+from scipy.fft import irfft, next_fast_len, rfft
+from numba import njit, prange
+from pedalboard import Pedalboard, PitchShift
+from fastapi import FastAPI, File, Form, HTTPException, UploadFile
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse
+from pydub import AudioSegment
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+app = FastAPI(title="NeoSong Audio Enhancement API")
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+ROOT_DIR = Path(__file__).parent
+UPLOAD_DIR = Path("/tmp/neosong/uploads")
+PROCESSED_DIR = Path("/tmp/neosong/processed")
+BACKGROUND_DIR = ROOT_DIR / "background_music"
+
+UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
+
+ALLOWED_EXTENSIONS = {".mp3", ".wav", ".m4a", ".flac", ".ogg"}
+
+BACKGROUND_TRACKS = {
+    "lofi_chill": "Lo-Fi Chill",
+    "soft_piano": "Soft Piano",
+    "ambient_pad": "Ambient Pad",
+    "vinyl_crackle": "Vinyl Crackle",
+}
+
+
+class BufferPool:
+    """Reuse large scratch arrays across requests to cut allocator churn.
+
+    Keeps a small ring of buffers per dtype and hands out sliced
+    views, growing a slot when a request needs more room. Consecutive
+    get() calls for the same dtype return different storage, so a
+    kernel can read the previously returned buffer while writing the
+    new one.
+    """
+
+    def __init__(self, slots=2):
+        self._slots = slots
+        self._buffers = {}
+        self._next = {}
+
+    def get(self, n, dtype=np.float32):
+        key = np.dtype(dtype).str
+        ring = self._buffers.setdefault(key, [])
+        if len(ring) < self._slots:
+            buffer = np.empty(n, dtype=dtype)
+            ring.append(buffer)
+            return buffer[:n]
+        i = self._next.get(key, 0) % self._slots
+        self._next[key] = i + 1
+        if ring[i].size < n:
+            ring[i] = np.empty(n, dtype=dtype)
+        return ring[i][:n]
+
+
+_scratch = threading.local()
+
+
+def _buffer_pool():
+    """Per-thread (and therefore per-worker-process) scratch pool."""
+    pool = getattr(_scratch, "pool", None)
+    if pool is None:
+        pool = _scratch.pool = BufferPool()
+    return pool
+
+
+@lru_cache(maxsize=32)
+def _reverb_impulse_response(sample_rate, decay, delay):
+    """Impulse response with 5 decaying taps spaced `delay` seconds apart."""
+    delay_samples = int(delay * sample_rate)
+    ir = np.zeros(delay_samples * 5 + 1, dtype=np.float32)
+    ir[0] = 1.0
+    for i in range(1, 6):
+        ir[i * delay_samples] = 0.3 * decay ** i
+    return ir
+
+
+def add_reverb(audio_data, sample_rate, decay=0.5, delay=0.05):
+    """Add reverb by convolving with a 5-tap decaying impulse response.
+
+    Overlap-add block convolution keeps the FFT working set at a few
+    multiples of the IR length regardless of file size, so long
+    uploads stay cache-resident instead of allocating one huge
+    complex buffer.
+    """
+    ir = _reverb_impulse_response(sample_rate, decay, delay)
+    return scipy.signal.oaconvolve(audio_data, ir, mode="full")[: len(audio_data)]
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _echo_kernel(x, delay_samples, decay, out):
+    """out[i] = x[i] + decay * x[i - delay], one read and one write per sample."""
+    for i in prange(x.shape[0]):
+        v = x[i]
+        if i >= delay_samples:
+            v += x[i - delay_samples] * decay
+        out[i] = v
+
+
+def add_echo(audio_data, sample_rate, delay=0.25, decay=0.4, scratch=None):
+    """Add a single echo tap at `delay` seconds."""
+    delay_samples = int(delay * sample_rate)
+    out = scratch if scratch is not None else np.empty_like(audio_data)
+    _echo_kernel(audio_data, delay_samples, decay, out)
+    return out
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _delay_chain_kernel(x, echo_delay, echo_decay, reverb_delay, reverb_decays, out):
+    """Fused reverb + echo: every tap is read in the same pass over x."""
+    for i in prange(x.shape[0]):
+        v = x[i]
+        if i >= echo_delay:
+            v += x[i - echo_delay] * echo_decay
+        for t in range(reverb_decays.shape[0]):
+            offset = (t + 1) * reverb_delay
+            if i >= offset:
+                v += x[i - offset] * reverb_decays[t]
+        out[i] = v
+
+
+def _apply_delay_chain(audio_data, sample_rate, effects, scratch=None):
+    """Run reverb and echo as one kernel when both are enabled.
+
+    Sums the first-order reverb and echo taps in a single pass over
+    the signal. This is a deliberate approximation of the old serial
+    add_reverb -> add_echo pipeline, which also echoed the reverb
+    tail (the cross terms of the two impulse responses); those
+    second-order taps are attenuated by both decays and are dropped
+    so the dry signal is read and written exactly once.
+    """
+    echo_delay = int(0.25 * sample_rate)
+    echo_decay = effects.get("echo_decay", 0.4)
+    reverb_delay = int(0.05 * sample_rate)
+    decay = effects.get("reverb_decay", 0.5)
+    reverb_decays = np.array(
+        [0.3 * decay ** i for i in range(1, 6)], dtype=np.float32
+    )
+    out = scratch if scratch is not None else np.empty_like(audio_data)
+    _delay_chain_kernel(
+        audio_data, echo_delay, echo_decay, reverb_delay, reverb_decays, out
+    )
+    return out
+
+
+def _shelf_coefficients(gain_db, freq, sample_rate, kind):
+    """RBJ cookbook shelving biquad as one second-order section."""
+    amp = 10 ** (gain_db / 40.0)
+    w0 = 2.0 * np.pi * freq / sample_rate
+    cos_w0 = np.cos(w0)
+    alpha = np.sin(w0) / 2.0 * np.sqrt(2.0)
+    two_sqrt_a_alpha = 2.0 * np.sqrt(amp) * alpha
+
+    if kind == "low":
+        b0 = amp * ((amp + 1) - (amp - 1) * cos_w0 + two_sqrt_a_alpha)
+        b1 = 2 * amp * ((amp - 1) - (amp + 1) * cos_w0)
+        b2 = amp * ((amp + 1) - (amp - 1) * cos_w0 - two_sqrt_a_alpha)
+        a0 = (amp + 1) + (amp - 1) * cos_w0 + two_sqrt_a_alpha
+        a1 = -2 * ((amp - 1) + (amp + 1) * cos_w0)
+        a2 = (amp + 1) + (amp - 1) * cos_w0 - two_sqrt_a_alpha
+    else:
+        b0 = amp * ((amp + 1) + (amp - 1) * cos_w0 + two_sqrt_a_alpha)
+        b1 = -2 * amp * ((amp - 1) + (amp + 1) * cos_w0)
+        b2 = amp * ((amp + 1) + (amp - 1) * cos_w0 - two_sqrt_a_alpha)
+        a0 = (amp + 1) - (amp - 1) * cos_w0 + two_sqrt_a_alpha
+        a1 = 2 * ((amp - 1) - (amp + 1) * cos_w0)
+        a2 = (amp + 1) - (amp - 1) * cos_w0 - two_sqrt_a_alpha
+
+    return np.array([b0 / a0, b1 / a0, b2 / a0, 1.0, a1 / a0, a2 / a0])
+
+
+@lru_cache(maxsize=64)
+def _eq_sos(sample_rate, bass_boost, treble_boost):
+    """Cascaded low-shelf (250 Hz) + high-shelf (4 kHz) sections."""
+    sections = []
+    if bass_boost != 0.0:
+        sections.append(_shelf_coefficients(bass_boost, 250.0, sample_rate, "low"))
+    if treble_boost != 0.0:
+        sections.append(_shelf_coefficients(treble_boost, 4000.0, sample_rate, "high"))
+    return np.vstack(sections)
+
+
+def apply_eq(audio_data, sample_rate, bass_boost=0.0, treble_boost=0.0):
+    """Boost bass/treble with IIR shelving filters.
+
+    Two-pole shelves run in O(N) with tiny state instead of a full
+    FFT round-trip, and avoid the pre-ringing that brickwall
+    bin-scaling introduces.
+    """
+    if bass_boost == 0.0 and treble_boost == 0.0:
+        return audio_data
+    sos = _eq_sos(sample_rate, bass_boost, treble_boost)
+    return scipy.signal.sosfilt(sos, audio_data)
+
+
+def apply_noise_reduction(audio_data, sample_rate, strength=0.5):
+    """Spectral gate: attenuate FFT bins below an estimated noise floor.
+
+    Uses a real FFT padded to a fast transform length and run across
+    all cores; half the work and memory of the complex np.fft path.
+    """
+    n = next_fast_len(len(audio_data))
+    spectrum = rfft(audio_data, n=n, workers=-1)
+    magnitude = np.abs(spectrum)
+    # 10th-percentile noise floor via introselect: O(N) and no
+    # interpolation, unlike np.percentile's sort-based path.
+    k = magnitude.size // 10
+    noise_floor = np.partition(magnitude, k)[k]
+
+    gate = magnitude < noise_floor * (1.0 + strength * 4.0)
+    spectrum[gate] *= (1.0 - strength)
+
+    return irfft(spectrum, n=n, workers=-1)[: len(audio_data)]
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _compress_kernel(x, threshold, ratio, out):
+    """out[i] = sign(x) * min(|x|, threshold + (|x| - threshold) / ratio)."""
+    for i in prange(x.shape[0]):
+        v = x[i]
+        mag = abs(v)
+        if mag > threshold:
+            mag = threshold + (mag - threshold) / ratio
+        out[i] = mag if v >= 0.0 else -mag
+
+
+def apply_compression(audio_data, threshold=0.5, ratio=4.0, scratch=None):
+    """Compress peaks above `threshold` by `ratio`."""
+    out = scratch if scratch is not None else np.empty_like(audio_data)
+    _compress_kernel(audio_data, threshold, ratio, out)
+    return out
+
+
+@lru_cache(maxsize=32)
+def _fade_in_curve(n):
+    return np.linspace(0.0, 1.0, n, dtype=np.float32)
+
+
+@lru_cache(maxsize=32)
+def _fade_out_curve(n):
+    return np.linspace(1.0, 0.0, n, dtype=np.float32)
+
+
+def apply_fade(audio_data, sample_rate, fade_in=0.0, fade_out=0.0):
+    """Apply linear fade-in/fade-out over the given durations (seconds).
+
+    Mutates `audio_data` in place; only the faded edges are touched
+    and the ramp curves are cached per sample count.
+    """
+    fade_in_samples = min(int(fade_in * sample_rate), len(audio_data))
+    fade_out_samples = min(int(fade_out * sample_rate), len(audio_data))
+
+    if fade_in_samples > 0:
+        audio_data[:fade_in_samples] *= _fade_in_curve(fade_in_samples)
+    if fade_out_samples > 0:
+        audio_data[-fade_out_samples:] *= _fade_out_curve(fade_out_samples)
+    return audio_data
+
+
+def apply_stereo_wide(audio_data, sample_rate, amount=0.5):
+    """Widen the signal with a short Haas-style delayed copy."""
+    delay_samples = int(0.012 * sample_rate)
+    widened = np.copy(audio_data)
+    if delay_samples < len(audio_data):
+        widened[delay_samples:] += audio_data[:-delay_samples] * (0.3 * amount)
+    return widened
+
+
+@lru_cache(maxsize=16)
+def _load_background(name):
+    """Decode a background track once per process; callers must not mutate it."""
+    path = BACKGROUND_DIR / f"{name}.mp3"
+    if not path.exists():
+        return None
+    return AudioSegment.from_file(str(path))
+
+
+@lru_cache(maxsize=16)
+def _background_samples(name, sample_rate):
+    """Mono float32 samples in [-1, 1] for a background track at `sample_rate`."""
+    segment = _load_background(name)
+    if segment is None:
+        return None
+    segment = segment.set_frame_rate(sample_rate).set_channels(1)
+    raw = np.frombuffer(segment.raw_data, dtype=np.int16)
+    return raw.astype(np.float32) / 32768.0
+
+
+def adjust_pitch(audio_data, sample_rate, semitones):
+    """Shift pitch by `semitones` without changing duration.
+
+    pedalboard's C++ Rubber Band wrapper is SIMD-accelerated and
+    releases the GIL, unlike librosa's Python phase vocoder.
+    """
+    board = Pedalboard([PitchShift(semitones=semitones)])
+    return board(audio_data.astype(np.float32), sample_rate)
+
+
+def adjust_tempo(audio_data, sample_rate, rate):
+    """Change tempo by `rate` (1.0 = unchanged) without changing pitch."""
+    return librosa.effects.time_stretch(y=audio_data.astype(np.float32), rate=rate)
+
+
+SOUNDFILE_EXTENSIONS = {".wav", ".flac", ".ogg"}
+
+
+def _decode_audio(input_file):
+    """Decode `input_file` to a float32 mono array plus sample rate.
+
+    Formats libsndfile understands are read straight into numpy;
+    pydub (and its ffmpeg subprocess) is only used for mp3/m4a.
+    Scale differs between the two paths but the pipeline normalizes
+    immediately after decode.
+    """
+    extension = Path(input_file).suffix.lower()
+    if extension in SOUNDFILE_EXTENSIONS:
+        data, sample_rate = soundfile.read(input_file, dtype="float32", always_2d=True)
+        if data.shape[1] > 1:
+            return data.mean(axis=1, dtype=np.float32), sample_rate
+        return data[:, 0], sample_rate
+
+    audio = AudioSegment.from_file(input_file)
+    samples = np.array(audio.get_array_of_samples(), dtype=np.float32)
+    if audio.channels == 2:
+        mono = np.empty(len(samples) // 2, dtype=np.float32)
+        np.mean(samples.reshape(-1, 2), axis=1, out=mono)
+        samples = mono
+    return samples, audio.frame_rate
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _scale_clip_to_i16(x, scale, out):
+    """Scale, clip and quantize to int16 in a single streaming pass."""
+    for i in prange(x.shape[0]):
+        v = x[i] * scale
+        if v > 32767.0:
+            v = 32767.0
+        elif v < -32768.0:
+            v = -32768.0
+        out[i] = np.int16(v)
+
+
+def _is_noop(effects, background_music):
+    """True when the requested effects leave the audio untouched."""
+    if any(
+        effects.get(key)
+        for key in ("reverb", "echo", "noise_reduction", "compression", "stereo_wide")
+    ):
+        return False
+    return (
+        effects.get("pitch_shift", 0) == 0
+        and effects.get("tempo", 1.0) == 1.0
+        and effects.get("volume", 1.0) == 1.0
+        and effects.get("bass_boost", 0.0) == 0.0
+        and effects.get("treble_boost", 0.0) == 0.0
+        and effects.get("fade_in", 0.0) == 0.0
+        and effects.get("fade_out", 0.0) == 0.0
+        and (not background_music or background_music == "none")
+    )
+
+
+def process_audio_file(input_file, output_file, effects, background_music=None):
+    """Run the effects pipeline over `input_file` and write MP3 to `output_file`."""
+    try:
+        # With no effects and no background track the pipeline would
+        # just decode and lossily re-encode; copy the source instead
+        # when it is already an MP3.
+        if _is_noop(effects, background_music):
+            if Path(input_file).suffix.lower() == ".mp3":
+                shutil.copyfile(input_file, output_file)
+                return True
+
+        pool = _buffer_pool()
+        samples, sample_rate = _decode_audio(input_file)
+        # Normalize in place: _decode_audio hands us a fresh buffer.
+        peak = np.abs(samples).max()
+        np.multiply(samples, 1.0 / peak, out=samples)
+        audio_data = samples
+
+        if effects.get("noise_reduction"):
+            audio_data = apply_noise_reduction(
+                audio_data, sample_rate, effects.get("noise_reduction_strength", 0.5)
+            )
+
+        if effects.get("pitch_shift", 0) != 0:
+            audio_data = adjust_pitch(audio_data, sample_rate, effects["pitch_shift"])
+
+        if effects.get("tempo", 1.0) != 1.0:
+            audio_data = adjust_tempo(audio_data, sample_rate, effects["tempo"])
+
+        bass_boost = effects.get("bass_boost", 0.0)
+        treble_boost = effects.get("treble_boost", 0.0)
+        if bass_boost != 0.0 or treble_boost != 0.0:
+            audio_data = apply_eq(audio_data, sample_rate, bass_boost, treble_boost)
+
+        if effects.get("reverb") and effects.get("echo"):
+            audio_data = _apply_delay_chain(
+                audio_data,
+                sample_rate,
+                effects,
+                scratch=pool.get(len(audio_data), audio_data.dtype),
+            )
+        elif effects.get("reverb"):
+            audio_data = add_reverb(
+                audio_data, sample_rate, decay=effects.get("reverb_decay", 0.5)
+            )
+        elif effects.get("echo"):
+            audio_data = add_echo(
+                audio_data,
+                sample_rate,
+                decay=effects.get("echo_decay", 0.4),
+                scratch=pool.get(len(audio_data), audio_data.dtype),
+            )
+
+        if effects.get("compression"):
+            audio_data = apply_compression(
+                audio_data, scratch=pool.get(len(audio_data), audio_data.dtype)
+            )
+
+        if effects.get("stereo_wide"):
+            audio_data = apply_stereo_wide(
+                audio_data, sample_rate, effects.get("stereo_wide_amount", 0.5)
+            )
+
+        fade_in = effects.get("fade_in", 0.0)
+        fade_out = effects.get("fade_out", 0.0)
+        if fade_in > 0 or fade_out > 0:
+            audio_data = apply_fade(audio_data, sample_rate, fade_in, fade_out)
+
+        # Stay in float until the very end: normalize/volume, mix the
+        # looped background in float, then clip and quantize exactly
+        # once in the fused pass from chunk0-2.
+        scale = effects.get("volume", 1.0) / np.max(np.abs(audio_data))
+
+        if background_music and background_music != "none":
+            bg_samples = _background_samples(background_music, sample_rate)
+        else:
+            bg_samples = None
+
+        if bg_samples is not None and len(bg_samples) > 0:
+            np.multiply(audio_data, scale, out=audio_data)
+            bg_volume = effects.get("bg_volume", 0.3)
+            idx = np.arange(len(audio_data)) % len(bg_samples)
+            np.add(audio_data, bg_samples[idx] * bg_volume, out=audio_data)
+            scale = 1.0
+
+        samples_int16 = pool.get(len(audio_data), np.int16)
+        _scale_clip_to_i16(audio_data, 32767.0 * scale, samples_int16)
+
+        # Encode in-process with LAME; pydub's export would fork an
+        # ffmpeg subprocess and pipe the whole buffer through stdio.
+        encoder = lameenc.Encoder()
+        encoder.set_bit_rate(192)
+        encoder.set_in_sample_rate(sample_rate)
+        encoder.set_channels(1)
+        encoder.set_quality(5)
+        mp3_data = encoder.encode(samples_int16.tobytes())
+        mp3_data += encoder.flush()
+        Path(output_file).write_bytes(bytes(mp3_data))
+        return True
+    except Exception as exc:
+        logger.error(f"Audio processing failed: {exc}")
+        return False
+
+
+@app.on_event("startup")
+async def _create_worker_pool():
+    # CPU-bound processing runs in separate processes so concurrent
+    # requests use multiple cores and never block the event loop.
+    app.state.pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+
+@app.on_event("shutdown")
+async def _shutdown_worker_pool():
+    app.state.pool.shutdown(wait=False, cancel_futures=True)
+
+
+@app.get("/api/health")
+async def health_check():
+    """Service liveness probe."""
+    return {"status": "healthy", "service": "NeoSong Audio Enhancement API"}
+
+
+@app.get("/api/background-music")
+async def list_background_music():
+    """List the available background music tracks."""
+    tracks = [
+        {"id": track_id, "name": name} for track_id, name in BACKGROUND_TRACKS.items()
+    ]
+    return {"tracks": tracks}
+
+
+@app.post("/api/upload-audio")
+async def upload_audio(file: UploadFile = File(...)):
+    """Store an uploaded audio file and return its id and duration."""
+    extension = Path(file.filename).suffix.lower()
+    if extension not in ALLOWED_EXTENSIONS:
+        raise HTTPException(status_code=400, detail="Unsupported audio format")
+
+    file_id = str(uuid.uuid4())
+    upload_path = UPLOAD_DIR / f"{file_id}{extension}"
+    async with aiofiles.open(upload_path, "wb") as buffer:
+        while chunk := await file.read(1 << 20):
+            await buffer.write(chunk)
+
+    # Read the duration from container metadata instead of decoding
+    # the whole file; a parse failure means the upload is not audio.
+    # mutagen returns None for unrecognized files but raises for
+    # recognized-but-corrupt ones, so both paths map to a 400.
+    try:
+        metadata = mutagen.File(str(upload_path))
+    except Exception:
+        metadata = None
+    if metadata is None or metadata.info is None:
+        upload_path.unlink(missing_ok=True)
+        raise HTTPException(status_code=400, detail="Could not decode audio file")
+    duration = metadata.info.length
+
+    return {
+        "file_id": file_id,
+        "filename": file.filename,
+        "duration": duration,
+    }
+
+
+def _find_uploaded_file(file_id):
+    for extension in ALLOWED_EXTENSIONS:
+        candidate = UPLOAD_DIR / f"{file_id}{extension}"
+        if candidate.exists():
+            return candidate
+    return None
+
+
+@app.post("/api/process-audio")
+async def process_audio(file_id: str = Form(...), effects: str = Form("{}")):
+    """Apply the requested effects to a previously uploaded file."""
+    input_file = _find_uploaded_file(file_id)
+    if input_file is None:
+        raise HTTPException(status_code=404, detail="File not found")
+
+    try:
+        effects_data = json.loads(effects)
+    except json.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid effects JSON")
+
+    processed_file_id = str(uuid.uuid4())
+    output_file = PROCESSED_DIR / f"{processed_file_id}.mp3"
+
+    loop = asyncio.get_running_loop()
+    success = await loop.run_in_executor(
+        app.state.pool,
+        process_audio_file,
+        str(input_file),
+        str(output_file),
+        effects_data,
+        effects_data.get("background_music"),
+    )
+    if not success:
+        raise HTTPException(status_code=500, detail="Audio processing failed")
+
+    return {"success": True, "processed_file_id": processed_file_id}
+
+
+# GET plus HEAD so header-only clients can probe without the body;
+# FileResponse already skips the file read for HEAD requests.
+@app.api_route("/api/preview/{file_id}", methods=["GET", "HEAD"])
+async def preview_audio(file_id: str):
+    """Stream an uploaded or processed file for in-browser preview."""
+    processed_path = PROCESSED_DIR / f"{file_id}.mp3"
+    if processed_path.exists():
+        return FileResponse(processed_path, media_type="audio/mpeg")
+
+    uploaded_path = _find_uploaded_file(file_id)
+    if uploaded_path is not None:
+        return FileResponse(uploaded_path, media_type="audio/mpeg")
+
+    raise HTTPException(status_code=404, detail="File not found")
+
+
+@app.api_route("/api/download/{file_id}", methods=["GET", "HEAD"])
+async def download_audio(file_id: str):
+    """Download a processed file as an attachment."""
+    processed_path = PROCESSED_DIR / f"{file_id}.mp3"
+    if not processed_path.exists():
+        raise HTTPException(status_code=404, detail="File not found")
+    return FileResponse(
+        processed_path,
+        media_type="audio/mpeg",
+        filename="neosong_enhanced.mp3",
+    )
+
+
+if __name__ == "__main__":
+    uvicorn.run(
+        "server:app",
+        host="0.0.0.0",
+        port=8001,
+        loop="uvloop",
+        http="httptools",
+    )
@@ -0,0 +1,149 @@
+"""HTTP tests for the NeoSong audio enhancement backend.
+
+Runs against the deployed backend URL from the frontend .env file.
+The suite forms a shallow dependency tree: one session-scoped upload
+(file_id) feeds the processing tests, and one session-scoped
+processing run (processed_file_id) feeds the preview/download
+assertions. Everything else is independent, so the leaves can be
+scheduled in parallel (pytest -n auto --dist loadfile) without
+repeating the upload. Shared fixtures live in conftest.py.
+"""
+import asyncio
+import io
+import logging
+
+import orjson
+import pytest
+
+from conftest import BASIC_EFFECTS, UPLOAD_TIMEOUT, post_process
+
+# Progress goes through one logging handler rather than per-line
+# print: pytest's capture batches the writes instead of flushing
+# stdout for every message.
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger("audio_tests")
+
+PRESETS = {
+    "rock": {"volume": 1.2, "bass_boost": 8, "treble_boost": 4, "compression": True},
+    "hip_hop": {"volume": 1.1, "bass_boost": 10, "compression": True, "echo": True},
+    "jazz": {"volume": 1.0, "bass_boost": 3, "treble_boost": 2, "reverb": True},
+    "ambient": {
+        "volume": 0.9,
+        "reverb": True,
+        "echo": True,
+        "fade_in": 1.0,
+        "fade_out": 1.0,
+    },
+}
+
+# The effect dicts are constants, so serialize the form payloads once
+# at import time instead of on every test run.
+PRESET_PAYLOADS = {
+    name: orjson.dumps(effects).decode() for name, effects in PRESETS.items()
+}
+ADVANCED_EFFECTS = orjson.dumps(
+    {
+        "reverb": True,
+        "echo": True,
+        "noise_reduction": True,
+        "compression": True,
+        "volume": 1.1,
+        "fade_in": 0.5,
+        "fade_out": 0.5,
+    }
+).decode()
+
+
+async def test_health_check(client):
+    response = await client.get("/api/health")
+    assert response.status_code == 200
+    assert response.json()["status"] == "healthy"
+    logger.info("✅ Health check passed")
+
+
+async def test_background_music(client):
+    response = await client.get("/api/background-music")
+    assert response.status_code == 200
+    data = response.json()
+    assert "tracks" in data
+    assert len(data["tracks"]) > 0
+    logger.info("✅ Background music list passed")
+
+
+async def test_upload_audio(client, audio_bytes):
+    # Independent upload so the endpoint itself stays covered; the
+    # other tests reuse the shared session-scoped file_id. The body
+    # comes from the in-memory fixture bytes, not a disk re-read.
+    files = {"file": ("test_audio.mp3", io.BytesIO(audio_bytes), "audio/mpeg")}
+    response = await client.post(
+        "/api/upload-audio", files=files, timeout=UPLOAD_TIMEOUT
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert "file_id" in data
+    assert data["duration"] > 0
+    logger.info("✅ Audio upload passed")
+
+
+async def test_process_audio_basic(client, file_id):
+    assert await post_process(client, file_id, BASIC_EFFECTS)
+    logger.info("✅ Basic audio processing passed")
+
+
+async def test_process_audio_advanced(client, file_id):
+    assert await post_process(client, file_id, ADVANCED_EFFECTS)
+    logger.info("✅ Advanced audio processing passed")
+
+
+async def test_preview_original(client, file_id):
+    # Header-only assertions: HEAD means the server never sends the
+    # MP3 body at all (the preview/download routes register HEAD
+    # explicitly; FastAPI's GET routes don't answer it on their own).
+    response = await client.head(f"/api/preview/{file_id}")
+    assert response.status_code == 200
+    assert response.headers["Content-Type"] == "audio/mpeg"
+    logger.info("✅ Original preview passed")
+
+
+async def test_preview_processed(client, processed_file_id):
+    response = await client.head(f"/api/preview/{processed_file_id}")
+    assert response.status_code == 200
+    assert response.headers["Content-Type"] == "audio/mpeg"
+    logger.info("✅ Processed preview passed")
+
+
+async def test_download_processed(client, processed_file_id):
+    # The one full GET in the suite: also validates the body is a
+    # plausible MP3, not just the headers.
+    response = await client.get(f"/api/download/{processed_file_id}")
+    assert response.status_code == 200
+    assert response.headers["Content-Type"] == "audio/mpeg"
+    assert "attachment" in response.headers.get("Content-Disposition", "")
+    assert len(response.content) > 0
+    assert response.content.startswith(b"ID3") or response.content[0] == 0xFF
+    logger.info("✅ Processed download passed")
+
+
+async def test_error_handling(client):
+    # The error paths are cheap on the server, so the four checks are
+    # RTT-bound; issuing them concurrently costs one round trip.
+    responses = await asyncio.gather(
+        client.post(
+            "/api/process-audio", data={"file_id": "invalid_id", "effects": "{}"}
+        ),
+        client.get("/api/preview/invalid_id"),
+        client.get("/api/download/invalid_id"),
+        client.post(
+            "/api/upload-audio",
+            files={"file": ("test.txt", b"not an audio file", "text/plain")},
+        ),
+    )
+    expected = [404, 404, 404, 400]
+    assert [response.status_code for response in responses] == expected
+    logger.info("✅ Error handling passed")
+
+
+@pytest.mark.parametrize("name,payload", sorted(PRESET_PAYLOADS.items()))
+async def test_preset(client, file_id, name, payload):
+    assert await post_process(client, file_id, payload)
+    logger.info(f"✅ {name} preset passed")
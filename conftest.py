@@ -0,0 +1,137 @@
+"""Shared fixtures for the backend HTTP tests.
+
+Session-scoped so the expensive steps - client/pool construction,
+the fixture upload and one warm processing run - happen once per
+test session instead of once per test.
+"""
+import io
+import os
+from pathlib import Path
+
+import httpx
+import numpy as np
+import orjson
+import pytest
+import pytest_asyncio
+from pydub import AudioSegment
+
+TEST_FILE_PATH = "/tmp/test_audio.mp3"
+FIXTURE_PATH = Path(__file__).parent / "tests" / "fixtures" / "sine_440hz_3s.mp3"
+
+# Separate connect/read budgets per endpoint class so a wedged
+# backend fails the test quickly instead of hanging the runner.
+CONNECT_TIMEOUT = 2.0
+FAST_TIMEOUT = httpx.Timeout(5.0, connect=CONNECT_TIMEOUT)
+UPLOAD_TIMEOUT = httpx.Timeout(30.0, connect=CONNECT_TIMEOUT)
+PROCESS_TIMEOUT = httpx.Timeout(120.0, connect=CONNECT_TIMEOUT)
+
+BASIC_EFFECTS = orjson.dumps({"volume": 1.2, "bass_boost": 5}).decode()
+
+# Touches the delay-chain and compression kernels so the backend's
+# Numba compilation happens before any measured test.
+WARMUP_EFFECTS = orjson.dumps(
+    {"reverb": True, "echo": True, "compression": True, "volume": 1.05}
+).decode()
+
+
+async def post_process(client, file_id, effects):
+    """POST one process-audio request and return the processed id.
+
+    Takes the pre-serialized effects payload so callers keep the
+    import-time orjson encoding; timeout and success checks live here
+    so future transport tweaks land in one place.
+    """
+    response = await client.post(
+        "/api/process-audio",
+        data={"file_id": file_id, "effects": effects},
+        timeout=PROCESS_TIMEOUT,
+    )
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["success"]
+    return body["processed_file_id"]
+
+
+def _backend_url():
+    with open("/app/frontend/.env") as env_file:
+        for line in env_file:
+            if line.startswith("REACT_APP_BACKEND_URL="):
+                return line.split("=", 1)[1].strip()
+    raise RuntimeError("REACT_APP_BACKEND_URL not found")
+
+
+def _create_test_audio_file():
+    """Link the cached fixture into /tmp, synthesizing it only once.
+
+    The tone is bit-identical across runs, so it lives under
+    tests/fixtures in the checkout; wiping /tmp (every fresh
+    container) costs an O(1) symlink instead of a re-encode.
+    """
+    if os.path.exists(TEST_FILE_PATH):
+        return
+    if not FIXTURE_PATH.exists():
+        FIXTURE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        sample_rate = 44100
+        t = np.arange(3 * sample_rate) / sample_rate
+        tone = (np.sin(2 * np.pi * 440.0 * t) * 0.5 * 32767).astype(np.int16)
+        segment = AudioSegment(
+            tone.tobytes(), frame_rate=sample_rate, sample_width=2, channels=1
+        )
+        segment.export(str(FIXTURE_PATH), format="mp3", bitrate="128k")
+    # exists() above follows symlinks, so a link left dangling by a
+    # cleaned checkout gets this far; drop it before relinking.
+    if os.path.lexists(TEST_FILE_PATH):
+        os.unlink(TEST_FILE_PATH)
+    os.symlink(FIXTURE_PATH, TEST_FILE_PATH)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client():
+    """One pooled async client for the whole suite."""
+    _create_test_audio_file()
+    limits = httpx.Limits(max_keepalive_connections=20)
+    async with httpx.AsyncClient(
+        base_url=_backend_url(), limits=limits, timeout=FAST_TIMEOUT
+    ) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def audio_bytes():
+    """The fixture MP3 read into memory once for the whole session.
+
+    Every upload after the first serves the multipart body straight
+    from this buffer instead of re-reading the file from disk.
+    """
+    _create_test_audio_file()
+    with open(TEST_FILE_PATH, "rb") as audio_file:
+        return audio_file.read()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def file_id(client, audio_bytes):
+    """Upload the fixture exactly once and share the id."""
+    files = {"file": ("test_audio.mp3", io.BytesIO(audio_bytes), "audio/mpeg")}
+    response = await client.post(
+        "/api/upload-audio", files=files, timeout=UPLOAD_TIMEOUT
+    )
+    assert response.status_code == 200, response.text
+    file_id = response.json()["file_id"]
+
+    # One discarded warmup run right after the upload: the first
+    # process request pays the server's JIT/library warm-up, so take
+    # that hit here instead of inside whichever test runs first.
+    response = await client.post(
+        "/api/process-audio",
+        data={"file_id": file_id, "effects": WARMUP_EFFECTS},
+        timeout=PROCESS_TIMEOUT,
+    )
+    assert response.status_code == 200, response.text
+
+    return file_id
+
+
+@pytest_asyncio.fixture(scope="session")
+async def processed_file_id(client, file_id):
+    """Process the shared upload once for the preview/download tests."""
+    return await post_process(client, file_id, BASIC_EFFECTS)